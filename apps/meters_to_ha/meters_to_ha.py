@@ -31,10 +31,13 @@
 from __future__ import annotations
 
 import argparse
+import copy
 import csv
 import datetime as dt
+import functools
 import glob
 import inspect
+import io
 import json
 import logging
 import os
@@ -42,16 +45,21 @@ import platform
 import random
 import re
 import signal
+import ssl
 import subprocess
 import sys
+import threading
 import time
 import traceback
 import urllib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from logging.handlers import RotatingFileHandler
+from operator import itemgetter
 from shutil import which
 from typing import Any
-from urllib.parse import urlencode, urlparse
+from urllib.parse import quote_plus, urlencode, urlparse
 
 VERSION = "v2.0"
 
@@ -59,6 +67,8 @@ LOGGER = logging.getLogger()
 
 HA_API_STATISTICS = "/api/services/recorder/import_statistics"
 HA_API_SENSOR_FORMAT = "/api/states/%s"
+# GRDF releve quality marking a real measurement (vs estimates/gaps).
+GRDF_QUAL_MEASURED = "Mesuré"
 PARAM_USE_CAPTCHA = "use_captcha"
 PARAM_2CAPTCHA_TOKEN = "2captcha_token"
 PARAM_CAPMONSTER_TOKEN = "capmonster_token"
@@ -68,12 +78,15 @@ CAPTCHA_TOKENS = (
     PARAM_2CAPTCHA_TOKEN,
     PARAM_CAPTCHAAI_TOKEN,
 )
+PARAM_CAPTCHA_POLL_INITIAL = "captcha_poll_initial"
+PARAM_CAPTCHA_POLL_MAX = "captcha_poll_max"
 PARAM_OPTIONAL_VALUE = (
     "Optional"  # Used internally to indicate optional dummy value
 )
 PARAM_USER_NONE_VALUE = (
     "None"  # Used by the user to indicate an absent configuration
 )
+_MISSING = object()  # Sentinel for absent configuration parameters
 PARAM_DOWNLOAD_FOLDER = "download_folder"
 PARAM_TIMEOUT = "timeout"
 PARAM_VEOLIA = "veolia"
@@ -122,6 +135,57 @@ INSTALL_DIR = "install_dir"
 
 REPO_BASE = "s0nik42/veolia-idf"
 
+# Memoized executable lookup - which() rescans $PATH on every call
+_which = functools.lru_cache(maxsize=None)(which)
+
+# Precompiled patterns (compile once, use on every config load)
+_FOLDER_RE = re.compile(r"folder$", re.IGNORECASE)
+_SECRET_RE = re.compile(r"(?:token|password)", re.IGNORECASE)
+_FF_VER_RE = re.compile(r"(\d+)\.(\d+)")
+
+# Immutable parts of the browser configuration, built once at import
+# instead of on every crawler instantiation.  Only the download
+# directory is overlaid per instance.
+_ACCEPT_TYPES = ",".join(["text/csv", "application/json"])
+
+_CHROME_ROOT_ARGS = (
+    "--no-sandbox",
+    "--disable-modal-animations",
+    "--disable-login-animations",
+    "--disable-renderer-backgrounding",
+    "--disable-dev-shm-usage",
+)
+
+_CHROME_ARGS = (
+    "--mute-audio",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-extensions",
+    "--disable-popup-blocking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-translate",
+    "--disable-notifications",
+    "--disable-infobars",
+)
+
+_CHROME_PREFS_BASE = {
+    "credentials_enable_service": False,
+    "profile.default_content_settings.popups": 1,
+    "profile.password_manager_enabled": False,
+    "download.prompt_for_download": False,
+    "download.directory_upgrade": True,
+    "extensions_to_open": _ACCEPT_TYPES,
+    "safebrowsing.enabled": False,
+}
+
+_FIREFOX_PREFS_BASE = {
+    "browser.download.folderList": 2,
+    "browser.helperApps.neverAsk.saveToDisk": _ACCEPT_TYPES,
+    "browser.download.manager.showWhenStarting": False,
+    "browser.helperApps.neverAsk.openFile": _ACCEPT_TYPES,
+    "browser.helperApps.alwaysAsk.force": False,
+}
+
 # Script provided by 2captcha to identify captcha information on the page
 SCRIPT_2CAPTCHA = r"""
 //
@@ -163,7 +227,56 @@ return data;
 return [];
 }
 """
+
+# Captcha discovery in a single webdriver round trip:
+# returns the sitekey and the page url from one execute_script call
+# instead of separate script/current_url commands.
+SCRIPT_GET_CAPTCHA_INFO = (
+    # Define the helper only when it was not already registered
+    # through CDP (init_chromium) - avoids re-parsing the blob.
+    "if (typeof window.findRecaptchaClients !== 'function') {"
+    + SCRIPT_2CAPTCHA
+    + "}"
+    + r"""
+return {
+    'sitekey': (findRecaptchaClients())[0].sitekey,
+    'pageurl': document.location.href
+};
+"""
+)
+
+try:
+    # Use the native orjson parser when available (accepts bytes,
+    # skips the utf-8 decode step); fall back to the stdlib.
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data)
+
+except ImportError:
+
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+
 hasUndetectedDriver = False
+hasWatchdog = False
+
+try:
+    # Optional: wake up on filesystem events while waiting for a
+    # download instead of polling the folder every second.
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    hasWatchdog = True
+except ImportError:
+    pass
 
 try:
     # Only add packages that are not built-in here
@@ -201,6 +314,23 @@ except ImportError as excImport:
     sys.exit(2)
 
 
+class SSLContextAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter sharing one SSLContext across the connection pool.
+
+    Reusing a single context keeps TLS session resumption working
+    between requests instead of rebuilding the context per call.
+    """
+
+    def __init__(self, ssl_context=None, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self._ssl_context is not None:
+            kwargs["ssl_context"] = self._ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+
 class Worker:
     install_dir = os.path.dirname(os.path.realpath(__file__))
     configuration: dict[str, Any] = {}
@@ -231,38 +361,35 @@ class Worker:
         Load configuration items as defined in self.configuration
         from provided parameters.
         """
-        for param in list((self.configuration).keys()):
-            if param not in config_dict:
-                if self.configuration[param] == PARAM_OPTIONAL_VALUE:
-                    self.configuration[param] = None
-                elif self.configuration[param] is not None:
-                    self.mylog(
-                        f'"{param}" not found in config file,'
-                        " using default value",
-                        "WW",
-                    )
-                else:
-                    self.mylog(f'    "{param}"', end="")
-                    raise RuntimeError(
-                        f"param {param} is missing in configuration file"
-                    )
+        # Single dict lookup per parameter; values are only assigned
+        # to existing keys, so iterating items() while updating is safe.
+        for param, default in self.configuration.items():
+            val = config_dict.get(param, _MISSING)
+            if val is not _MISSING:
+                self.configuration[param] = val
+            elif default == PARAM_OPTIONAL_VALUE:
+                self.configuration[param] = None
+            elif default is not None:
+                self.mylog(
+                    f'"{param}" not found in config file,'
+                    " using default value",
+                    "WW",
+                )
             else:
-                self.configuration[param] = config_dict[param]
+                self.mylog(f'    "{param}"', end="")
+                raise RuntimeError(
+                    f"param {param} is missing in configuration file"
+                )
 
             # Sanity check, parameter cleanup, report
             val = self.configuration[param]
             val_str = str(self.configuration[param])
 
-            if (
-                re.search(r"folder$", param, re.IGNORECASE)
-                and val_str[-1] != os.path.sep
-            ):
+            if _FOLDER_RE.search(param) and val_str[-1] != os.path.sep:
                 val_str += os.path.sep
                 self.configuration[param] = val_str
 
-            if val is not None and re.search(
-                r"(token|password)", param, re.IGNORECASE
-            ):
+            if val is not None and _SECRET_RE.search(param):
                 self.mylog(
                     f'    "{param}" = "{"*" * len(val_str)}"',
                     end="",
@@ -276,7 +403,9 @@ class Worker:
             self.mylog(st="OK")
         # LOGGER.debug("%r->%r", config_dict, self.configuration)
 
-    def default_mylog(self, string="", st=None, end=None):
+    def default_mylog(self, string="", st=None, end=None, args=None):
+        if args:
+            string = string % args
         st = f"[{st}] " if st else ""
         if end is None:
             print(f"{st}{string}")
@@ -309,11 +438,11 @@ class Output(Worker):
 
         # In standard mode log to a file
         if self._use_display is False:
-            # Check if we can create logfile
-            try:
-                open(logfile, "a+", encoding="utf_8").close()
-            except Exception as e:
-                raise RuntimeError(f'"{logfile}" {e}')
+            # Check we can create the logfile; the handler creates it
+            # lazily on the first record, so probing the directory is
+            # enough and avoids touching the file here.
+            if not check_file_writable(logfile):
+                raise RuntimeError(f'"{logfile}" is not writable')
 
             # Set the logfile format
             file_handler = RotatingFileHandler(logfile, "a", 1000000, 1)
@@ -323,7 +452,9 @@ class Output(Worker):
             LOGGER.addHandler(file_handler)
             self.mylog = self.__print_to_logfile
 
-    def __print_to_console(self, string="", st=None, end=None):
+    def __print_to_console(self, string="", st=None, end=None, args=None):
+        if args:
+            string = string % args
         if st:
             st = st.upper()
             st = st.replace("OK", Fore.GREEN + "OK")
@@ -332,19 +463,30 @@ class Output(Worker):
             st = "[" + st + Style.RESET_ALL + "] "
 
         if end is not None:
+            # Partials must show up right away so the console reflects
+            # the step in progress; one write+flush per partial.
             st = st + " " if st else ""
-            print(st + "%-75s" % (string,), end=end, flush=True)
+            sys.stdout.write(st + "%-75s" % (string,) + end)
+            sys.stdout.flush()
             self.__print_buffer = self.__print_buffer + string
         elif self.__print_buffer:
+            # The partial is already on screen; close its line.
             st = st if st else "[--] "
-            print(st + string.rstrip())
+            sys.stdout.write(st + string.rstrip() + "\n")
+            sys.stdout.flush()
             self.__print_buffer = ""
         else:
             st = st if st else "[--]"
-            print(("{:75s}" + st).format(string.rstrip()))
+            sys.stdout.write("%-75s%s\n" % (string.rstrip(), st))
+            sys.stdout.flush()
             self.__print_buffer = ""
 
-    def __print_to_logfile(self, string="", st=None, end=None):
+    def __print_to_logfile(self, string="", st=None, end=None, args=None):
+        if not LOGGER.isEnabledFor(logging.INFO):
+            # Skip the %-formatting work when nothing will be emitted
+            return
+        if args:
+            string = string % args
         if end is not None:
             self.__print_buffer = self.__print_buffer + string
         else:
@@ -363,9 +505,60 @@ class Output(Worker):
 
 def document_initialised(driver):
     """
-    Execute JavaScript in browser to confirm page is loaded.
+    Check in browser that the document completed loading.
+
+    Intended as a WebDriverWait condition; polling readyState detects
+    actual load completion instead of only confirming the JS bridge.
     """
-    return driver.execute_script("return true;")
+    return (
+        driver.execute_script("return document.readyState") == "complete"
+    )
+
+
+def _read_csv_tail(path, n=3, window=8192):
+    """
+    Return the last ``n`` rows of a ';'-separated CSV as lists.
+
+    Reads a single window from the end of the file instead of
+    streaming every row; falls back to a full scan when the window
+    does not cover ``n`` complete lines.
+    """
+    size = os.path.getsize(path)
+    if size > window:
+        with open(path, "rb") as f:
+            f.seek(size - window)
+            chunk = f.read()
+        # Drop the first, most likely partial, line of the window.
+        parts = chunk.split(b"\n", 1)
+        if len(parts) == 2:
+            text = parts[1].decode("utf_8")
+            rows = deque(
+                csv.reader(io.StringIO(text), delimiter=";"), maxlen=n
+            )
+            if len(rows) == n:
+                return list(rows)
+    with open(path, encoding="utf_8", newline="") as f:
+        return list(deque(csv.reader(f, delimiter=";"), maxlen=n))
+
+
+@functools.lru_cache(maxsize=8)
+def _normalize_pageurl(page_url: str) -> str:
+    """
+    Reduce a page URL to its scheme://host:port root for the captcha
+    services; memoized because the portal URL is constant per run.
+    """
+    parsed = urlparse(page_url)
+    append_port = ""
+    if ":" not in parsed.netloc:
+        append_port = ":443" if parsed.scheme == "https" else ":80"
+    new_url = parsed._replace(
+        netloc=parsed.netloc + append_port,
+        path="",
+        params="",
+        query="",
+        fragment="",
+    )
+    return new_url.geturl()
 
 
 def print_classes(modulename=__name__):
@@ -392,6 +585,38 @@ def check_file_writable(fnm):
     return os.access(pdir, os.W_OK)
 
 
+_XOK_CACHE: dict[str, bool] = {}
+
+
+def check_executable(path):
+    """
+    Check that path is an executable file, caching the stat result.
+
+    The same driver/browser paths are probed several times during
+    startup; one stat per path replaces repeated access() syscalls.
+    """
+    result = _XOK_CACHE.get(path)
+    if result is None:
+        try:
+            result = bool(os.stat(path).st_mode & 0o111)
+        except OSError:
+            result = False
+        _XOK_CACHE[path] = result
+    return result
+
+
+@functools.lru_cache(maxsize=8)
+def _load_json_file(path, mtime_ns):  # pylint: disable=unused-argument
+    """
+    Load a json file, memoized on (path, mtime).
+
+    Repeated invocations (daemon/AppDaemon setups) skip the disk read
+    and parse as long as the file is unchanged.
+    """
+    with open(path, "rb") as conf_file:
+        return _json_loads(conf_file.read())
+
+
 ###############################################################################
 # Configuration Class to parse and load config.json
 ###############################################################################
@@ -399,15 +624,23 @@ class Configuration(Worker):
     def load_configuration_file(self, configuration_file):
         python_version = platform.python_version()
         self.mylog(
-            f"Using {sys.executable} Version {python_version}", end="--"
+            "Using %s Version %s",
+            end="--",
+            args=(sys.executable, python_version),
         )
         self.mylog(
-            f"Loading configuration file : {configuration_file}", end="--"
+            "Loading configuration file : %s",
+            end="--",
+            args=(configuration_file,),
         )
         try:
-            with open(configuration_file, encoding="utf_8") as conf_file:
-                content = json.load(conf_file)
-        except json.JSONDecodeError as e:
+            mtime_ns = os.stat(configuration_file).st_mtime_ns
+            # Deep-copy: callers update the returned dict in place.
+            content = copy.deepcopy(
+                _load_json_file(configuration_file, mtime_ns)
+            )
+        except ValueError as e:
+            # stdlib and orjson decode errors both derive from ValueError
             raise RuntimeError(f"json format error : {e}")
         except Exception:
             raise
@@ -431,6 +664,33 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
     hasFirefox = False
     hasChromium = False
 
+    # Locators used by the veolia crawl, defined once here instead of
+    # being rebuilt inline at every wait/click.
+    SEL_V_PASSWORD_OR_PROFILE = (
+        By.CSS_SELECTOR,
+        r'input[type="password"],.profileIcon',
+    )
+    SEL_V_PASSWORD = (By.CSS_SELECTOR, r'input[type="password"]')
+    SEL_V_EMAIL = (By.XPATH, r"//input[@inputmode='email']")
+    SEL_V_LOGO = (By.CSS_SELECTOR, r".logo")
+    SEL_V_MENU = (
+        By.XPATH,
+        r"//span[contains(text(), 'CONTRATS')"
+        r" or contains(text(), 'HISTORIQUE')]",
+    )
+    SEL_V_LITRES = (
+        By.XPATH,
+        r"//span[contains(text(), 'Litres')]/parent::node()",
+    )
+    SEL_V_JOURS = (
+        By.XPATH,
+        r"//span[contains(text(), 'Jours')]/parent::node()",
+    )
+    SEL_V_TELECHARGEMENT = (
+        By.XPATH,
+        r'//button[contains(text(),"charger la p")]',
+    )
+
     def __init__(
         self,
         config_dict,
@@ -445,6 +705,15 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
         self.__display = None
         self.__browser = None  # type: webdriver.Firefox
         self.__wait = None  # type: WebDriverWait
+        self.__firefox_version: tuple[int, int] | None = None
+        # Pooled HTTP session: keep-alive avoids a fresh TCP+TLS
+        # connection for every captcha service request.
+        self._http = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=10, max_retries=0
+        )
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
         self.configuration = {
             # Config values (veolia)
             PARAM_USE_CAPTCHA: False,
@@ -462,21 +731,21 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
             PARAM_SCREENSHOT: PARAM_OPTIONAL_VALUE,
             PARAM_SKIP_DOWNLOAD: False,
             PARAM_KEEP_OUTPUT: False,
-            PARAM_GECKODRIVER: which("geckodriver")
-            if which("geckodriver")
+            PARAM_GECKODRIVER: _which("geckodriver")
+            if _which("geckodriver")
             else os.path.join(config_dict[INSTALL_DIR], "geckodriver"),
-            PARAM_FIREFOX: which("firefox")
-            if which("firefox")
+            PARAM_FIREFOX: _which("firefox")
+            if _which("firefox")
             else os.path.join(config_dict[INSTALL_DIR], "firefox"),
-            PARAM_CHROMIUM: which("chromium")
-            if which("chromium")
-            else which("chromium-browser")
-            if which("chromium-browser")
+            PARAM_CHROMIUM: _which("chromium")
+            if _which("chromium")
+            else _which("chromium-browser")
+            if _which("chromium-browser")
             else "/usr/bin/chromium-browser"
             if os.path.exists("/usr/bin/chromium-browser")
             else os.path.join(config_dict[INSTALL_DIR], "chromium"),
-            PARAM_CHROMEDRIVER: which("chromedriver")
-            if which("chromedriver")
+            PARAM_CHROMEDRIVER: _which("chromedriver")
+            if _which("chromedriver")
             else os.path.join(config_dict[INSTALL_DIR], "chromedriver"),
             PARAM_CHROME_VERSION: PARAM_OPTIONAL_VALUE,
             PARAM_TIMEOUT: "30",
@@ -485,6 +754,8 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
             PARAM_2CAPTCHA_TOKEN: PARAM_OPTIONAL_VALUE,
             PARAM_CAPMONSTER_TOKEN: PARAM_OPTIONAL_VALUE,
             PARAM_CAPTCHAAI_TOKEN: PARAM_OPTIONAL_VALUE,
+            PARAM_CAPTCHA_POLL_INITIAL: "5",
+            PARAM_CAPTCHA_POLL_MAX: "15",
             PARAM_LOG_LEVEL: "DEBUG",  # error, warning, info, debug
         }
 
@@ -497,6 +768,36 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
         else:
             self.mylog(st="OK")
 
+        # Resolve the configured captcha service once; the
+        # configuration is immutable after loading.
+        self._captcha_method = next(
+            (
+                m
+                for m in CAPTCHA_TOKENS
+                if self.configuration.get(m) not in (None, "")
+            ),
+            None,
+        )
+
+        # Cache hot configuration values as plain attributes; they are
+        # read on every wait/click/screenshot and are immutable after
+        # the configuration is loaded.
+        self._timeout = int(str(self.configuration[PARAM_TIMEOUT]))
+        self._captcha_poll_initial = int(
+            str(self.configuration[PARAM_CAPTCHA_POLL_INITIAL])
+        )
+        self._captcha_poll_max = int(
+            str(self.configuration[PARAM_CAPTCHA_POLL_MAX])
+        )
+        self._logs_folder = str(self.configuration[PARAM_LOGS_FOLDER])
+        self._geckodriver_log = os.path.join(
+            self._logs_folder, "geckodriver.log"
+        )
+        self._chromedriver_log = os.path.join(
+            self._logs_folder, "chromedriver.log"
+        )
+        self._debug = self.get_log_level() <= logging.DEBUG
+
         self.__full_path_download_veolia_idf_file = os.path.join(
             self.configuration[PARAM_DOWNLOAD_FOLDER],
             self.download_veolia_filename,
@@ -522,6 +823,15 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
                 return
         except (Exception, xauth.NotFoundError):
             self.mylog(st="~~")
+            # Stop a partially started display before the Chromium
+            # attempt; init_chromium starts its own.  Leaking the Xvfb
+            # process would slow down the fallback and the shutdown.
+            if self.__display is not None:
+                try:
+                    self.__display.stop()
+                except Exception:
+                    pass
+                self.__display = None
 
         if self.hasChromium:
             # Firefox did not load, try Chromium
@@ -541,6 +851,23 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
             self.configuration[PARAM_LOG_LEVEL].upper()
         )
 
+    def __set_command_pool_size(self, browser, maxsize=10):
+        """
+        Raise the connection pool size of the webdriver command executor.
+
+        The default pool size of 1 discards and reopens the keep-alive
+        socket to the driver whenever commands overlap, adding reconnect
+        latency to every execute call.
+        """
+        try:
+            # pylint: disable=protected-access
+            browser.command_executor._conn = urllib3.PoolManager(
+                maxsize=maxsize
+            )
+        except Exception:
+            # Selenium internals changed; keep the default pool.
+            pass
+
     # INIT DISPLAY & BROWSER
     def init_firefox(self):
         self.mylog("Start virtual display (Firefox).", end="")
@@ -562,24 +889,14 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
 
         self.mylog("Setup Firefox profile", end="")
         try:
-            accept_types = ",".join(["text/csv", "application/json"])
             # Enable Download
             opts = webdriver.FirefoxOptions()
             opts.set_preference(
                 "browser.download.dir",
                 self.configuration[PARAM_DOWNLOAD_FOLDER],
             )
-            opts.set_preference("browser.download.folderList", 2)
-            opts.set_preference(
-                "browser.helperApps.neverAsk.saveToDisk", accept_types
-            )
-            opts.set_preference(
-                "browser.download.manager.showWhenStarting", False
-            )
-            opts.set_preference(
-                "browser.helperApps.neverAsk.openFile", accept_types
-            )
-            opts.set_preference("browser.helperApps.alwaysAsk.force", False)
+            for pref, value in _FIREFOX_PREFS_BASE.items():
+                opts.set_preference(pref, value)
 
             # Set firefox binary to use
             opts.binary_location = FirefoxBinary(
@@ -588,9 +905,7 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
 
             ff_service = FirefoxService(
                 executable_path=self.configuration[PARAM_GECKODRIVER],
-                log_path=os.path.join(
-                    self.configuration[PARAM_LOGS_FOLDER], "geckodriver.log"
-                ),
+                log_path=self._geckodriver_log,
             )
             if not hasattr(ff_service, "process"):
                 # Webdriver may complain about missing process.
@@ -619,11 +934,12 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
 
         self.mylog("Start Firefox", end="")
         try:
+            self.__set_command_pool_size(browser)
             # browser.maximize_window()
             # Replaced maximize_window by set_window_size
             # to get the window full screen
             browser.set_window_size(1600, 1200)
-            timeout = int(self.configuration[PARAM_TIMEOUT])  # type:ignore
+            timeout = self._timeout
             self.__wait = WebDriverWait(browser, timeout=timeout)
         except Exception:
             raise
@@ -647,11 +963,8 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
             and os.geteuid() == 0  # pylint: disable=no-member
         ):
             self.mylog("Add nix root user options.")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-modal-animations")
-            options.add_argument("--disable-login-animations")
-            options.add_argument("--disable-renderer-backgrounding")
-            options.add_argument("--disable-dev-shm-usage")
+            for arg in _CHROME_ROOT_ARGS:
+                options.add_argument(arg)
 
         local_dir = str(self.configuration[PARAM_DOWNLOAD_FOLDER])
 
@@ -667,35 +980,16 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
             self.mylog(f"Use {datadir} for Google Chrome user data.")
 
         # options.add_argument('--user-data-dir=~/.config/google-chrome')
-        options.add_argument("--mute-audio")
         # if self._use_display:
         #     Does not work well with veolia due to multiple "same" elements
         #     options.add_argument("--auto-open-devtools-for-tabs")
-        options.add_experimental_option(
-            "prefs",
-            {
-                "credentials_enable_service": False,
-                "download.default_directory": self.configuration[
-                    PARAM_DOWNLOAD_FOLDER
-                ],
-                "profile.default_content_settings.popups": 1,
-                "profile.password_manager_enabled": False,
-                "download.prompt_for_download": False,
-                "download.directory_upgrade": True,
-                "extensions_to_open": ",".join(
-                    ["text/csv", "application/json"]
-                ),
-                "safebrowsing.enabled": False,
-            },
-        )
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-popup-blocking")
-        options.add_argument("--disable-background-timer-throttling")
-        options.add_argument("--disable-backgrounding-occluded-windows")
-        options.add_argument("--disable-translate")
-        options.add_argument("--disable-notifications")
-        options.add_argument("--disable-infobars")
+        for arg in _CHROME_ARGS:
+            options.add_argument(arg)
+        prefs = dict(_CHROME_PREFS_BASE)
+        prefs["download.default_directory"] = self.configuration[
+            PARAM_DOWNLOAD_FOLDER
+        ]
+        options.add_experimental_option("prefs", prefs)
 
         if not hasUndetectedDriver:
             options.add_experimental_option("useAutomationExtension", False)
@@ -707,9 +1001,6 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
                 "excludeSwitches", ["enable-logging"]
             )
 
-        if sys.platform != "win32":
-            self.mylog("Start virtual display (Chromium).", end="")
-
         if log_level < logging.INFO:
             options.add_argument("--enable-logging")
             options.add_argument("--log-level=1")
@@ -726,36 +1017,30 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
                 # Workaround breaking change selenium 4.13.0
                 options.headless = False
         else:
+            # A headless browser does not need a (virtual) display;
+            # skipping Xvfb saves a process start and its shutdown.
             options.add_argument("--headless")
             if getattr(options, "headless", "_DUMMY_") == "_DUMMY_":
                 # Workaround breaking change selenium 4.13.0
                 options.headless = True
             if sys.platform != "win32":
-                try:
-                    options.add_argument("--disable-gpu")
-                    self.__display = Display(visible=0, size=(1280, 1024))
-                except Exception:
-                    raise
+                options.add_argument("--disable-gpu")
             else:
                 options.add_argument("window-size=1280,1024")
 
-        if sys.platform != "win32":
+        if self.__display is not None:
+            self.mylog("Start virtual display (Chromium).", end="")
             try:
                 self.__display.start()
             except Exception:
                 raise
-
-        # No exception up to here, so ok
-        self.mylog(st="OK")
+            self.mylog(st="OK")
 
         # Discover classes provided
         # print_classes("selenium.webdriver") ; sys.exit()
         # print_classes("selenium.webdriver.chrome.service") ; sys.exit()
 
-        chromedriver_log = os.path.join(
-            self.configuration[PARAM_LOGS_FOLDER],
-            "chromedriver.log",
-        )
+        chromedriver_log = self._chromedriver_log
         chromium_service_args = (
             ["--verbose"] if log_level < logging.INFO else None
         )
@@ -802,8 +1087,20 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
                     options=options,
                 )
 
+            self.__set_command_pool_size(browser)
+            try:
+                # Register the captcha helper once per page context so
+                # the browser parses and compiles it a single time.
+                browser.execute_cdp_cmd(
+                    "Page.addScriptToEvaluateOnNewDocument",
+                    {"source": SCRIPT_2CAPTCHA},
+                )
+            except Exception:
+                # No CDP support; resolve_captcha2 defines the helper
+                # inline when it is missing.
+                pass
             browser.maximize_window()
-            timeout = int(self.configuration[PARAM_TIMEOUT])  # type:ignore
+            timeout = self._timeout
             self.__wait = WebDriverWait(browser, timeout)
         except AttributeError:
             self.mylog("chromium unknown in selenium webdriver", end="--")
@@ -840,10 +1137,8 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
                     self.mylog(f"Can't reuse missing '{v_file}'", "EE")
                     raise RuntimeError(f"Can't reuse missing '{v_file}'")
 
-                try:
-                    open(v_file, "a+", encoding="utf_8").close()
-                except Exception as e:
-                    raise RuntimeError(f'"{v_file}" {e}')
+                if not check_file_writable(v_file):
+                    raise RuntimeError(f'"{v_file}" is not writable')
 
                 checkBrowser = True
                 self.mylog(st="OK")
@@ -866,9 +1161,9 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
         )
 
         hasBrowser = False
-        if os.access(
-            str(self.configuration[PARAM_GECKODRIVER]), os.X_OK
-        ) and os.access(str(self.configuration[PARAM_FIREFOX]), os.X_OK):
+        if check_executable(
+            str(self.configuration[PARAM_GECKODRIVER])
+        ) and check_executable(str(self.configuration[PARAM_FIREFOX])):
             self.mylog("Check firefox browser version", end="")
             try:
                 major, minor = self.__get_firefox_version()
@@ -888,8 +1183,8 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
 
         if (
             hasUndetectedDriver
-            or os.access(str(self.configuration[PARAM_CHROMEDRIVER]), os.X_OK)
-        ) and os.access(str(self.configuration[PARAM_CHROMIUM]), os.X_OK):
+            or check_executable(str(self.configuration[PARAM_CHROMEDRIVER]))
+        ) and check_executable(str(self.configuration[PARAM_CHROMIUM])):
             if hasUndetectedDriver:
                 extraMsg = " with undetected driver"
             else:
@@ -910,9 +1205,20 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
             )
 
     def __get_firefox_version(self):
+        # The binary does not change during the process lifetime,
+        # so spawn 'firefox --version' only once.
+        if self.__firefox_version is not None:
+            return self.__firefox_version
+
         try:
-            output = subprocess.check_output(
-                [str(self.configuration[PARAM_FIREFOX]), "--version"]
+            # timeout avoids hanging on a wedged binary; text=True
+            # spares the bytes->str conversion of the output.
+            result = subprocess.run(
+                [str(self.configuration[PARAM_FIREFOX]), "--version"],
+                capture_output=True,
+                text=True,
+                timeout=5,
+                check=True,
             )
         except Exception:
             raise
@@ -920,16 +1226,19 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
         try:
             major, minor = map(
                 int,
-                re.search(
-                    r"(\d+).(\d+)", str(output)
+                _FF_VER_RE.search(
+                    result.stdout
                 ).groups(),  # type:ignore[union-attr]
             )
         except Exception:
             raise
 
-        return major, minor
+        self.__firefox_version = (major, minor)
+        return self.__firefox_version
 
     def cleanup(self, keep_output=False):
+        self._http.close()
+
         self.mylog("Close Browser", end="")
         if self.__browser:
             pid = self.__browser.service.process.pid
@@ -987,7 +1296,7 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
 
         if timeout is None:
             # No timeout provided, default timeout
-            timeout = int(self.configuration[PARAM_TIMEOUT])
+            timeout = self._timeout
 
         ep = EC.visibility_of_element_located(
             (
@@ -1015,7 +1324,7 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
     ):
         """
         1. Wait until element is visible
-        2. Wait for delay.
+        2. Wait until element is clickable (at most 'delay' seconds).
         3. Bring into view (location may have changed)
         4. Click
         """
@@ -1026,7 +1335,7 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
 
         if timeout is None:
             # No timeout provided, default timeout
-            timeout = self.configuration[PARAM_TIMEOUT]
+            timeout = self._timeout
 
         timeout_message = f"Failed, page timeout (timeout={timeout})"
 
@@ -1042,9 +1351,22 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
         self.mylog(st="OK")
 
         if delay != 0.0:
-            self.mylog(f"Wait before clicking ({delay:.1f}s).", end="")
+            # 'delay' is a maximum: poll until the element is clickable
+            # instead of sleeping the full fixed delay.
+            self.mylog(f"Wait before clicking (max {delay:.1f}s).", end="")
             self.mylog(st="~~")
-            time.sleep(delay)
+            try:
+                el = WebDriverWait(
+                    self.__browser, delay, poll_frequency=0.1
+                ).until(
+                    EC.element_to_be_clickable((method, key)),
+                    message=timeout_message,
+                )
+            except selenium.common.exceptions.TimeoutException:
+                # Not reported clickable; the poll already consumed the
+                # allotted delay, try clicking the located element
+                # anyway.
+                pass
 
         # Bring the element into view
         el.location_once_scrolled_into_view
@@ -1066,7 +1388,7 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
         Get screenshot and save to file in logs_folder
         """
 
-        fn_img = os.path.join(self.configuration[PARAM_LOGS_FOLDER], basename)
+        fn_img = os.path.join(self._logs_folder, basename)
         # Screenshots are only for debug, so errors are not blocking.
         try:
             self.mylog(f"Grab & Save '{fn_img}'. ", end="--")
@@ -1087,14 +1409,37 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
                 self.mylog(f"Could not dump html {fn_html}: {e}", end="")
 
     def resolve_captcha2(self) -> str | None:
+        """
+        Scrape the captcha from the page, solve it remotely and inject
+        the token. Touches the browser: must run on its thread.
+        """
+        if self._captcha_method is None:
+            # Bail out before touching the page: the scrape script
+            # raises a JS error when no captcha widget is present.
+            self.mylog(
+                "Can not resolve using captcha service - "
+                "missing one of ('%s')" % ("', '".join(CAPTCHA_TOKENS),),
+                st="WW",
+            )
+            return None
+        captcha_info = self.__browser.execute_script(
+            SCRIPT_GET_CAPTCHA_INFO
+        )
+        captcha_results = self._solve_captcha_remote(captcha_info)
+        if captcha_results is not None:
+            self._apply_captcha_result(captcha_results)
+        return captcha_results
+
+    def _solve_captcha_remote(self, captcha_info) -> str | None:
+        """
+        Solve a scraped captcha through the configured remote service.
+
+        Pure HTTP - no webdriver access - so it is safe to run on a
+        worker thread while the browser session stays on the main one.
+        """
         # pylint: disable=too-many-locals,too-many-return-statements
 
-        method = None
-        for m in CAPTCHA_TOKENS:
-            key = self.configuration[m]
-            if key is not None and key != "":
-                method = m
-                break
+        method = self._captcha_method
 
         if method is None:
             self.mylog(
@@ -1104,54 +1449,10 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
             )
             return None
 
-        if False:
-            captcha_results = "XXXXMARIOXXXXMARIO"
-            SELECT_SCRIPT_TEMPLATE = """
-               document.querySelector('[name="g-recaptcha-response"]').innerText='{}'
-            """
-            select_script = SELECT_SCRIPT_TEMPLATE.format(captcha_results)
-            # print(f"select_script}\n")
-            self.__browser.execute_script(select_script)
-            time.sleep(5000)
-
-        if False:
-            self.__browser.switch_to.frame(2)
-            # r"recaptcha-verify-button" is not the correct button
-            #  to click after validation!
-            button = self.__browser.find_element(
-                By.ID, r"recaptcha-verify-button"
-            )
-            self.__browser.switch_to.default_content()
+        key = self.configuration[method]
 
-        # Method 1 to find key
-        GET_KEY = r"""
-            return (new URLSearchParams(
-              document.querySelector("iframe[title=\'reCAPTCHA\']")
-                .getAttribute("src")))
-            .get("k")
-            """
-        # Method 2 to find key
-        GET_KEY = (
-            SCRIPT_2CAPTCHA + r"return (findRecaptchaClients())[0].sitekey;"
-        )
-        site_key = self.__browser.execute_script(GET_KEY)
-        page_url = str(self.__browser.current_url)
-        parsed = urlparse(page_url)
-        # print(f"{parsed!r}\n")
-        append_port = ""
-        if ":" not in parsed.netloc:
-            append_port = ":443" if parsed.scheme == "https" else ":80"
-        new_url = parsed._replace(
-            netloc=parsed.netloc + append_port,
-            path="",
-            params="",
-            query="",
-            fragment="",
-        )
-        short_url = new_url.geturl()
-
-        # print(f"{short_url}\n")
-        page_url = short_url
+        site_key = captcha_info["sitekey"]
+        page_url = _normalize_pageurl(str(captcha_info["pageurl"]))
 
         if method in (PARAM_2CAPTCHA_TOKEN, PARAM_CAPTCHAAI_TOKEN):
             captchamethod = "userrecaptcha"
@@ -1181,42 +1482,56 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
             self.mylog(f"{service} {url}", st="~~")
             retries = 3
             while retries > 0:
-                response = requests.get(url, timeout=10)
+                response = self._http.get(url, timeout=10)
+                # The body is tiny and known to be utf-8; setting the
+                # encoding avoids chardet detection on .text access.
+                response.encoding = "utf-8"
+                txt = response.text
                 retries -= 1
-                if response.text[0:2] == "OK":
+                if txt[0:2] == "OK":
                     break
                 self.mylog(
-                    f"{service} Service error: Error code {response.text}",
+                    f"{service} Service error: Error code {txt}",
                     st="WW",
                 )
                 if retries <= 0:
                     return None
                 time.sleep(2)
 
-            self.mylog(f"{service} Service response {response.text}", st="~~")
+            if self._debug:
+                self.mylog(
+                    "%s Service response %s", st="~~", args=(service, txt)
+                )
 
-            captcha_id = response.text[3:]
+            captcha_id = txt[3:]
             # Polling for response
             token_url = f"{uri}/res.php?key={key}&action=get&id={captcha_id}"
 
-            max_loops = 12
-            timeout = 20
+            # Poll with exponential backoff: short first poll for
+            # fast solves, capped delay for slow ones.
+            delay = self._captcha_poll_initial
+            deadline = time.monotonic() + 180
             captcha_results = None
-            while max_loops > 0:
-                max_loops -= 1
+            while time.monotonic() < deadline:
                 self.mylog(
-                    f"Wait {timeout}s for {service}",
+                    "Wait %ss for %s",
                     st="~~",
+                    args=(delay, service),
                 )
-                time.sleep(timeout)
-                timeout = 10
-                response = requests.get(token_url, timeout=10)
+                time.sleep(delay)
+                delay = min(int(delay * 1.5), self._captcha_poll_max)
+                response = self._http.get(token_url, timeout=10)
+                response.encoding = "utf-8"
+                txt = response.text
 
-                self.mylog(
-                    f"{service} Service response {response.text}", st="~~"
-                )
-                if response.text[0:2] == "OK":
-                    captcha_results = response.text[3:]
+                if self._debug:
+                    self.mylog(
+                        "%s Service response %s",
+                        st="~~",
+                        args=(service, txt),
+                    )
+                if txt[0:2] == "OK":
+                    captcha_results = txt[3:]
                     break
         elif method == PARAM_CAPMONSTER_TOKEN:
             headers = {"Accept-Encoding": "application/json"}
@@ -1234,7 +1549,7 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
                 # "softId":
             }
             api_url = "https://api.capmonster.cloud/createTask"
-            response = requests.post(
+            response = self._http.post(
                 api_url, headers=headers, json=api_data, timeout=10
             )
             if response.status_code != 200:
@@ -1244,7 +1559,7 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
                     st="EE",
                 )
                 return None
-            resp_data = response.json()
+            resp_data = _json_loads(response.content)
             if "errorId" in resp_data and resp_data["errorId"] != 0:
                 self.mylog(
                     f"{service} error {resp_data['errorId']}:"
@@ -1261,13 +1576,14 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
                 "taskId": taskId,
             }
 
-            max_loops = 12
+            delay = self._captcha_poll_initial
+            deadline = time.monotonic() + 180
             captcha_results = None
-            while max_loops > 0:
-                max_loops -= 1
-                self.mylog(f"Wait 10s for {service}", st="~~")
-                time.sleep(10)
-                response = requests.post(
+            while time.monotonic() < deadline:
+                self.mylog("Wait %ss for %s", st="~~", args=(delay, service))
+                time.sleep(delay)
+                delay = min(int(delay * 1.5), self._captcha_poll_max)
+                response = self._http.post(
                     token_url, headers=headers, json=token_data, timeout=10
                 )
 
@@ -1280,7 +1596,7 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
                     # Try again - we've successfully requested a task
                     continue
 
-                resp_data = response.json()
+                resp_data = _json_loads(response.content)
                 if "errorId" in resp_data and resp_data["errorId"] != 0:
                     self.mylog(
                         f"{service} error {resp_data['errorId']}:"
@@ -1294,35 +1610,26 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
                     ]
                     break
 
-        if captcha_results is not None:
-            FILL_CAPTCHA_TEMPLATE = r"""
-                document.querySelector('[name="g-recaptcha-response"]')
-                   .innerText='{}';
-            """
-            select_script = FILL_CAPTCHA_TEMPLATE.format(captcha_results)
-            VALIDATE_JS = """
-                return (findRecaptchaClients())[0]
-                  .function('{captcha_results}');
-            """
-
-            select_script += VALIDATE_JS
-
-            # print(select_script)
-            self.__browser.execute_script(select_script)
-
-            if False:
-                self.__browser.switch_to.frame(2)
-                button = self.__browser.find_element(
-                    By.ID, r"recaptcha-verify-button"
-                )
-                # print(f"button:{button!r}\n")
-                button.click()
+        return captcha_results
 
-            # sys.exit()
-            return captcha_results
+    def _apply_captcha_result(self, captcha_results) -> None:
+        """
+        Inject the solved token into the page (browser thread only).
+        """
+        FILL_CAPTCHA_TEMPLATE = r"""
+            document.querySelector('[name="g-recaptcha-response"]')
+               .innerText='{}';
+        """
+        select_script = FILL_CAPTCHA_TEMPLATE.format(captcha_results)
+        VALIDATE_JS = """
+            return (findRecaptchaClients())[0]
+              .function('{captcha_results}');
+        """
 
-        # time.sleep(120)  # For inspection
-        return None
+        select_script += VALIDATE_JS
+
+        # print(select_script)
+        self.__browser.execute_script(select_script)
 
     def getDownloadedFileName(self, waitTime: float) -> str | None:
         """Get downloaded filename in browser, wait for end of download"""
@@ -1420,26 +1727,23 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
         self.mylog(st="OK")
 
         ep = EC.visibility_of_any_elements_located(
-            (By.CSS_SELECTOR, r'input[type="password"],.profileIcon')
+            self.SEL_V_PASSWORD_OR_PROFILE
         )
         self.__wait.until(
             ep,
             message="Failed, page timeout (timeout="
-            + str(self.configuration[PARAM_TIMEOUT])
+            + str(self._timeout)
             + ")",
         )
 
-        try:
-            # If profile element is present, likely already logged in
-            if self.configuration[PARAM_SCREENSHOT]:
-                self.get_screenshot("check_profile.png")
-            profile_el = self.__browser.find_element(
-                By.CLASS_NAME, "profileIcon"
-            )
-            if profile_el is not None:
-                isLoggedIn = True
-        except Exception:
-            isLoggedIn = False
+        # If profile element is present, likely already logged in.
+        # find_elements returns [] on absence instead of waiting for
+        # the implicit timeout and raising.
+        if self.configuration[PARAM_SCREENSHOT]:
+            self.get_screenshot("check_profile.png")
+        isLoggedIn = bool(
+            self.__browser.find_elements(By.CLASS_NAME, "profileIcon")
+        )
 
         if not isLoggedIn:
             # Wait for Password ######
@@ -1448,12 +1752,12 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
             self.mylog("Waiting for Password", end="")
 
             ep = EC.visibility_of_any_elements_located(
-                (By.CSS_SELECTOR, r'input[type="password"]')
+                self.SEL_V_PASSWORD
             )
             el_password = self.__wait.until(
                 ep,
                 message="failed, page timeout (timeout="
-                + str(self.configuration[PARAM_TIMEOUT])
+                + str(self._timeout)
                 + ")",
             )
             # Get first (and normally only) visible element
@@ -1465,12 +1769,12 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
             # visibility depends on screen size.
             self.mylog("Waiting for Email", end="")
             ep = EC.visibility_of_any_elements_located(
-                (By.XPATH, r"//input[@inputmode='email']")
+                self.SEL_V_EMAIL
             )
             el_email = self.__wait.until(
                 ep,
                 message="failed, page timeout (timeout="
-                + str(self.configuration[PARAM_TIMEOUT])
+                + str(self._timeout)
                 + ")",
             )
             # Get first (and normally only) visible element
@@ -1506,6 +1810,8 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
 
         # for filename in glob.glob(v_file_glob):
         for filename in (v_file,):  # Loop to replace the above alternative
+            if not os.path.lexists(filename):
+                continue
             try:
                 self.mylog(
                     f"Remove temporary download file '{filename}'. ", end=""
@@ -1517,11 +1823,11 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
                 self.mylog(st="OK")
 
         # Wait until element is at least visible
-        ep = EC.visibility_of_any_elements_located((By.CSS_SELECTOR, r".logo"))
+        ep = EC.visibility_of_any_elements_located(self.SEL_V_LOGO)
         self.__wait.until(
             ep,
             message="Failed, page timeout (timeout="
-            + str(self.configuration[PARAM_TIMEOUT])
+            + str(self._timeout)
             + ")",
         )
 
@@ -1534,18 +1840,12 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
         # Different handling dependent on multiple or single contract
 
         self.mylog("Wait for MENU contrats or historique", end="")
-        ep = EC.visibility_of_element_located(
-            (
-                By.XPATH,
-                r"//span[contains(text(), 'CONTRATS')"
-                r" or contains(text(), 'HISTORIQUE')]",
-            )
-        )
+        ep = EC.visibility_of_element_located(self.SEL_V_MENU)
         try:
             el = self.__wait.until(
                 ep,
                 message="failed, page timeout (timeout="
-                + str(self.configuration[PARAM_TIMEOUT])
+                + str(self._timeout)
                 + ")",
             )
         except Exception:
@@ -1553,8 +1853,6 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
 
         self.mylog(st="OK")
 
-        time.sleep(2)
-
         menu_type = str(el.get_attribute("innerHTML"))
 
         # Click on Menu #####
@@ -1566,18 +1864,15 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
 
         # GESTION DU PARCOURS MULTICONTRATS
         if menu_type == "CONTRATS":
-            time.sleep(2)
             contract_id = str(self.configuration[PARAM_VEOLIA_CONTRACT])
             self.click_in_view(
                 By.LINK_TEXT,
                 contract_id,
                 wait_message=f"Select contract : {contract_id}",
                 click_message="Click on contract",
-                delay=0,
+                delay=2,
             )
 
-        time.sleep(2)
-
         # Click Historique #####
         self.click_in_view(
             By.LINK_TEXT,
@@ -1587,13 +1882,10 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
             delay=4,
         )
 
-        time.sleep(10)
-
         try:
             # Click Litres #####
             self.click_in_view(
-                By.XPATH,
-                r"//span[contains(text(), 'Litres')]/parent::node()",
+                *self.SEL_V_LITRES,
                 wait_message="Wait for button Litres",
                 click_message="Click on button Litres",
                 delay=2,
@@ -1609,7 +1901,6 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
                 click_message="Click on Alertes de consommation",
                 delay=2,
             )
-            time.sleep(2)
             self.click_in_view(
                 By.XPATH,
                 r"//a[contains(@class,'cICL_Tab')]"
@@ -1618,31 +1909,24 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
                 click_message="Click on Historique",
                 delay=2,
             )
-            time.sleep(2)
             self.click_in_view(
-                By.XPATH,
-                r"//span[contains(text(), 'Litres')]/parent::node()",
+                *self.SEL_V_LITRES,
                 wait_message="Wait for button Litres",
                 click_message="Click on button Litres",
                 delay=2,
             )
 
-        time.sleep(2)
-
         # Click Jours #####
         self.click_in_view(
-            By.XPATH,
-            r"//span[contains(text(), 'Jours')]/parent::node()",
+            *self.SEL_V_JOURS,
             wait_message="Wait for button Jours",
             click_message="Click on button Jours",
             delay=2,
         )
 
-        time.sleep(2)
         # Click Telechargement #####
         self.click_in_view(
-            By.XPATH,
-            r'//button[contains(text(),"charger la p")]',
+            *self.SEL_V_TELECHARGEMENT,
             wait_message="Wait for button Telechargement",
             click_message="Click on button Telechargement",
             delay=10,
@@ -1653,44 +1937,80 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
             end="",
         )
 
-        t = int(str(self.configuration[PARAM_TIMEOUT]))
+        t = self._timeout
         elapsed = 0
-        while t > 0 and not glob.glob(v_file_glob):
-            time.sleep(1)
-            t -= 1
-            elapsed += 1
-            if elapsed < 2:
-                # Do not try alternative until some time passed
-                continue
-            try:
-                # For some reason (possibly Security setting),
-                # the CSV file is not written to disk in Chrome 110.
-                #
-                # After the click on HISTORIQUE, the data is provided
-                # in a hidden link as a data link.
-                #
-                # This code gets that data link, decodes it and saves
-                # the data so that it is available at the expected
-                # location.
-                csvDataLink = self.__browser.find_element(
-                    By.XPATH,
-                    f"//a[@download='{self.download_veolia_filename}']",
-                )
-                data = csvDataLink.get_attribute("href")
-
-                response = urllib.request.urlopen(data)  # nosec
-                self.mylog(
-                    f"Write '{v_file}'. ",
-                    st="--",
-                    end="",
-                )
-                with open(v_file, "wb") as f:
-                    f.write(response.file.read())
+        download_event = None
+        observer = None
+        if hasWatchdog:
+            # Wake up as soon as the download folder changes instead
+            # of always sleeping out the full 1 second slice. The
+            # polling body below still runs: it carries the Chrome 110
+            # data-link workaround.
+            download_event = threading.Event()
+
+            class _DownloadHandler(FileSystemEventHandler):
+                def on_created(self, event):
+                    download_event.set()
+
+                def on_moved(self, event):
+                    download_event.set()
+
+            observer = Observer()
+            observer.schedule(_DownloadHandler(), os.path.dirname(v_file))
+            observer.start()
+
+        found: list[str] = []
+        try:
+            while t > 0:
+                found = glob.glob(v_file_glob)
+                if found:
+                    break
+                if download_event is not None:
+                    download_event.wait(1)
+                    download_event.clear()
+                else:
+                    time.sleep(1)
+                t -= 1
+                elapsed += 1
+                if elapsed < 2:
+                    # Do not try alternative until some time passed
+                    continue
+                try:
+                    # For some reason (possibly Security setting),
+                    # the CSV file is not written to disk in Chrome 110.
+                    #
+                    # After the click on HISTORIQUE, the data is provided
+                    # in a hidden link as a data link.
+                    #
+                    # This code gets that data link, decodes it and saves
+                    # the data so that it is available at the expected
+                    # location.
+                    csvDataLink = self.__browser.find_element(
+                        By.XPATH,
+                        f"//a[@download='{self.download_veolia_filename}']",
+                    )
+                    data = csvDataLink.get_attribute("href")
 
-            except Exception:
-                pass
+                    response = urllib.request.urlopen(data)  # nosec
+                    self.mylog(
+                        f"Write '{v_file}'. ",
+                        st="--",
+                        end="",
+                    )
+                    with open(v_file, "wb") as f:
+                        f.write(response.file.read())
 
-        found = glob.glob(v_file_glob)
+                except Exception:
+                    pass
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+
+        if not found:
+            # On timeout, check once more: the workaround above may
+            # have written the file during the last iteration.
+            found = glob.glob(v_file_glob)
         # Most recent first in list
         found.sort(key=os.path.getmtime, reverse=True)
         if found and os.path.exists(found[0]):
@@ -1722,27 +2042,19 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
             self.get_screenshot("00_screenshot_before_user.png")
 
         content: None | str = None
-        isLoggedIn = False
 
-        try:
-            # If date_debut is present, likely already logged in
-            date_debut_el = self.__browser.find_element(By.ID, "date-debut")
-            if date_debut_el is not None:
-                isLoggedIn = True
-        except Exception:
-            isLoggedIn = False
+        # If date-debut is present, likely already logged in.
+        isLoggedIn = bool(
+            self.__browser.find_elements(By.ID, "date-debut")
+        )
 
         if not isLoggedIn:
             # Check if there is a Cookies Consent popup deny button #####
-            deny_btn = None
-            try:
-                deny_btn = self.__browser.find_element(
-                    By.ID, "btn_option_deny_banner"
-                )
-            except Exception:
-                pass
+            deny_btns = self.__browser.find_elements(
+                By.ID, "btn_option_deny_banner"
+            )
 
-            if deny_btn is not None:
+            if deny_btns:
                 self.click_in_view(
                     By.ID,
                     "btn_option_deny_banner",
@@ -1751,20 +2063,23 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
                     delay=0,  # random.uniform(1, 2),
                 )
 
+                # The deny click can navigate away; only then is a
+                # reload needed. The page was already loaded above,
+                # so skip the redundant GET otherwise.
+                self.mylog("Get url", end="")
+                self.__browser.get(self.__class__.site_grdf_url)
+                self.mylog(st="OK")
+
             # Wait for Connexion #####
             self.mylog("Connexion au site GRDF", end="")
 
-            self.mylog("Get url", end="")
-            self.__browser.get(self.__class__.site_grdf_url)
-            self.mylog(st="OK")
-
             # Wait for Email #####
             self.mylog("Waiting for Email", end="")
             ep = EC.presence_of_element_located((By.ID, "input27"))
             el_email = self.__wait.until(
                 ep,
                 message="failed, page timeout (timeout="
-                + str(self.configuration[PARAM_TIMEOUT])
+                + str(self._timeout)
                 + ")",
             )
             self.mylog(st="OK")
@@ -1794,7 +2109,7 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
             el_password = self.__wait.until(
                 ep,
                 message="failed, page timeout (timeout="
-                + str(self.configuration[PARAM_TIMEOUT])
+                + str(self._timeout)
                 + ")",
             )
             self.mylog(st="OK")
@@ -1807,16 +2122,17 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
             re_btn = self.__browser.find_element(
                 By.ID, "grdfButton"
             )
-            re_btn.click()   
+            re_btn.click()
+
             time.sleep(3)
-                       
+
             if self.configuration[PARAM_SCREENSHOT]:
-                self.get_screenshot("03_screenshot_after_password_se_connecter.png")             
+                self.get_screenshot("03_screenshot_after_password_se_connecter.png")
 
             CONNEXION_XPATH = r"//input[@value='Connexion']"
-            
+
             if self.configuration[PARAM_USE_CAPTCHA]:
-            
+
                 self.mylog("Proceed with captcha resolution. ", end="~~")
                 if self.resolve_captcha2() is not None:
                     # Some time for captcha to remove.
@@ -1826,29 +2142,26 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
                     # Manual
                     time.sleep(0.33)
 
-                    # Not sure that click is needed for 2captcha
-                    clickRecaptcha = True
-                    if clickRecaptcha:
-                        self.mylog("Clicking on the captcha button. ", end="~~")
-                        self.__browser.switch_to.frame(0)
-                        re_btn = self.__browser.find_element(
-                            By.CLASS_NAME, "recaptcha-checkbox-border"
+                    self.mylog("Clicking on the captcha button. ", end="~~")
+                    self.__browser.switch_to.frame(0)
+                    re_btn = self.__browser.find_element(
+                        By.CLASS_NAME, "recaptcha-checkbox-border"
+                    )
+                    re_btn.click()
+                    self.__browser.switch_to.default_content()
+
+                    # Try to click connexion in case captcha worked.
+                    try:
+                        self.click_in_view(
+                            By.XPATH,
+                            CONNEXION_XPATH,
+                            # wait_message="",
+                            click_message="Click on connexion",
+                            delay=random.uniform(1, 2),
                         )
-                        re_btn.click()
-                        self.__browser.switch_to.default_content()
-
-                        # Try to click connexion in case captcha worked.
-                        try:
-                            self.click_in_view(
-                                By.XPATH,
-                                CONNEXION_XPATH,
-                                # wait_message="",
-                                click_message="Click on connexion",
-                                delay=random.uniform(1, 2),
-                            )
-                            # Even if click succeeded, not always connected
-                        except Exception:
-                            pass
+                        # Even if click succeeded, not always connected
+                    except Exception:
+                        pass
 
                     waitUntilConnexionGone = 2
                     if self._use_display:
@@ -1882,15 +2195,11 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
 
             if not isLoggedIn:
                 # Check if there is a Cookies Consent popup deny button #####
-                deny_btn = None
-                try:
-                    deny_btn = self.__browser.find_element(
-                        By.ID, "btn_option_deny_banner"
-                    )
-                except Exception:
-                    pass
+                deny_btns = self.__browser.find_elements(
+                    By.ID, "btn_option_deny_banner"
+                )
 
-                if deny_btn is not None:
+                if deny_btns:
                     self.click_in_view(
                         By.ID,
                         "btn_option_deny_banner",
@@ -1975,7 +2284,7 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
 
                 try:
                     filename = self.getDownloadedFileName(
-                        int(self.configuration[PARAM_TIMEOUT])
+                        self._timeout
                     )
                     if filename is None:
                         msg = f"No downloaded File. {msg}"
@@ -1995,10 +2304,6 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
 
             if content is None:
                 self.mylog(msg, end="EE")
-            # result = json.loads(content)
-            # r=self.__browser.requests[-1:][0]
-            # self.__browser(self.__browser.wait_for_request(r.path))
-            # print(f"Url {data_url} -> R:{result!r}\n")
 
         if content is None:
             raise ValueError("No content")
@@ -2007,7 +2312,6 @@ class ServiceCrawler(Worker):  # pylint:disable=too-many-instance-attributes
             self.files_to_cleanup.append(g_file)
 
         with open(g_file, "w", encoding="utf_8") as grdf_file:
-            # json.dump(result, grdf_file)
             self.mylog(f"Writing '{g_file}'. ", end="~~")
             grdf_file.write(content)
 
@@ -2041,100 +2345,97 @@ class Injector(Worker):
         # pylint: disable=too-many-locals
         self.mylog("Parsing csv file.")
 
-        with open(csv_file, encoding="utf_8") as f:
-            data: dict[str, Any] = {}
-
-            rows = list(csv.reader(f, delimiter=";"))
-            # List has at least two rows, the exception handles it.
-            row = rows[-1]
-            p_row = rows[-2]
-
-            method = row[3]  # "Mesuré" or "Estimé"
-            if method in ("Estimé",):
-                self.mylog(f"File contains estimated data in last line: {row}")
-                # Try previous row which may be a measurement
-                row = p_row
-                p_row = rows[-3]
-
-            date = row[0][0:10]
-            date_time = row[0]
-            meter_total = row[1]
-            meter_period_total = row[2]
-            method = row[3]  # "Mesuré" or "Estimé"
-
-            p_date_time = p_row[0]
-            p_meter_total = p_row[1]
-            p_meter_period_total = p_row[2]
-
-            if method in ("Estimé",):
-                self.mylog("    Skip Method " + method)
-                # Do not use estimated values which may result
-                # in a total that is not increasing
-                # (when the estimated value is smaller than the
-                #  previous real value or higher than the next
-                #  real value)
-                raise RuntimeError(
-                    f"File contains estimated data in last lines: {row!r}"
-                )
+        data: dict[str, Any] = {}
+
+        # Only the file tail is used; read a window from the end of
+        # the file instead of streaming every row.
+        rows = _read_csv_tail(csv_file)
+        # List has at least two rows, the exception handles it.
+        row = rows[-1]
+        p_row = rows[-2]
+
+        method = row[3]  # "Mesuré" or "Estimé"
+        if method in ("Estimé",):
+            self.mylog(f"File contains estimated data in last line: {row}")
+            # Try previous row which may be a measurement
+            row = p_row
+            p_row = rows[-3]
+
+        date = row[0][0:10]
+        date_time = row[0]
+        meter_total = row[1]
+        meter_period_total = row[2]
+        method = row[3]  # "Mesuré" or "Estimé"
+
+        p_date_time = p_row[0]
+        p_meter_total = p_row[1]
+        p_meter_period_total = p_row[2]
+
+        if method in ("Estimé",):
+            self.mylog("    Skip Method " + method)
+            # Do not use estimated values which may result
+            # in a total that is not increasing
+            # (when the estimated value is smaller than the
+            #  previous real value or higher than the next
+            #  real value)
+            raise RuntimeError(
+                f"File contains estimated data in last lines: {row!r}"
+            )
 
-            # Check line integrity (Date starting with 2 (Year))
-            if date[0] == "2":
-                # Verify data integrity :
-                d1 = datetime.strptime(date, "%Y-%m-%d")
-                d2 = datetime.now()
-                if abs((d2 - d1).days) > 30:
-                    raise RuntimeError(
-                        f"File contains too old data (monthly?!?): {row!r}"
-                    )
-                self.mylog(
-                    f"    previous value  {p_date_time}: "
-                    f"{p_meter_total}L - {p_meter_period_total}L",
-                    end="",
-                )
-                self.mylog(
-                    f"    update value is {date_time}: "
-                    f"{meter_total}L - {meter_period_total}L",
-                    end="",
+        # Check line integrity (Date starting with 2 (Year))
+        if date[0] == "2":
+            # Verify data integrity :
+            # Fixed YYYY-MM-DD layout; direct slicing is much
+            # cheaper than strptime's format-string walk.
+            d1 = dt.date(
+                int(date[0:4]), int(date[5:7]), int(date[8:10])
+            )
+            d2 = dt.date.today()
+            if abs((d2 - d1).days) > 30:
+                raise RuntimeError(
+                    f"File contains too old data (monthly?!?): {row!r}"
                 )
+            self.mylog(
+                f"    previous value  {p_date_time}: "
+                f"{p_meter_total}L - {p_meter_period_total}L",
+                end="",
+            )
+            self.mylog(
+                f"    update value is {date_time}: "
+                f"{meter_total}L - {meter_period_total}L",
+                end="",
+            )
 
-                data = {
-                    "date_time": date_time,
-                    "contract": self.configuration[PARAM_VEOLIA_CONTRACT],
-                    "meter_total": meter_total,
-                    "total_unit": "L",
-                    "device_class": "water",
-                    "daily_total": meter_period_total,
-                    "daily_unit": "L",
-                }
+            data = {
+                "date_time": date_time,
+                "contract": self.configuration[PARAM_VEOLIA_CONTRACT],
+                "meter_total": meter_total,
+                "total_unit": "L",
+                "device_class": "water",
+                "daily_total": meter_period_total,
+                "daily_unit": "L",
+            }
 
-                return data
+            return data
         return None
 
     def parse_grdf_historical_data(self, json_file, pce):
         self.mylog(f"Parsing json file: {json_file}")       
-        stats_array = []
-        with open(json_file, 'r') as f:
-            data = json.load(f)
+        with open(json_file, "rb") as f:
+            data = _json_loads(f.read())
             rows = data[pce]["releves"]
-            date_format = "%Y-%m-%dT%H:%M:%S%z"
-            # Iterate through each row in  order
-            for row in rows:
-                #self.mylog(f"Row {row}", end="~~")
-                date_obj = dt.datetime.strptime(row["dateDebutReleve"], date_format)
-                
-                date_with_timezone = date_obj.replace(tzinfo=dt.timezone.utc)
-
-                date_formatted = date_with_timezone.strftime(
-                    "%Y-%m-%dT%H:%M:%S%z"
-                )
-                stat = {
-                    "start": date_formatted,  # formatted date
+            # The previous strptime/replace(tzinfo=utc)/strftime round
+            # trip only relabelled the wall time as UTC; on the fixed
+            # ISO layout that is a plain string operation.
+            stats_array = [
+                {
+                    "start": row["dateDebutReleve"][:19] + "+0000",
                     "state": row["volumeBrutConsomme"],
-                    "sum": row["indexFin" ],
+                    "sum": row["indexFin"],
                 }
-                # Add the stat to the array
-                stats_array.append(stat)
-                
+                for row in rows
+            ]
+
         self.mylog(f"Parsed stats array '{stats_array}'. ", end="~~")
         self.mylog(st="OK")
         return stats_array
@@ -2172,30 +2473,45 @@ class DomoticzInjector(Injector):
         )
         self.revision: int = 0
 
-    def open_url(self, uri, data=None):  # pylint: disable=unused-argument
-        # Generate URL
-        url = str(self.configuration[PARAM_DOMOTICZ_SERVER]) + uri
-
-        # Add Authentication Items if needed
+        # Base URL and authentication do not change after the
+        # configuration is loaded; compute them once instead of on
+        # every request (update_veolia_device fires one per CSV row).
+        self._base_url = str(self.configuration[PARAM_DOMOTICZ_SERVER])
         if (
             self.configuration[PARAM_DOMOTICZ_LOGIN] != ""
             and self.configuration[PARAM_DOMOTICZ_PASSWORD] != ""
         ):
-            http_auth = (
+            self._http_auth = (
                 self.configuration[PARAM_DOMOTICZ_LOGIN],
                 self.configuration[PARAM_DOMOTICZ_PASSWORD],
             )
-
         else:
-            http_auth = None
+            self._http_auth = None
+
+        # Pooled keep-alive session so the per-row back-fill reuses
+        # its connections instead of renegotiating one per request;
+        # transient gateway errors are retried with backoff.
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=16,
+            max_retries=urllib3.util.Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.auth = self._http_auth
+        self._session.verify = not (self.configuration[PARAM_INSECURE])
+
+    def open_url(self, uri, data=None):  # pylint: disable=unused-argument
+        # Generate URL
+        url = self._base_url + uri
 
         try:
-            response = requests.get(
-                url,
-                verify=not (self.configuration[PARAM_INSECURE]),
-                auth=http_auth,
-                timeout=30,
-            )
+            response = self._session.get(url, timeout=30)
         except Exception as e:
             # HANDLE CONNECTIVITY ERROR
             raise RuntimeError(f"url={url} : {e}")
@@ -2212,7 +2528,8 @@ class DomoticzInjector(Injector):
             )
 
         try:
-            j = json.loads(response.content.decode("utf_8"))
+            # orjson-backed, takes the response bytes directly.
+            j = _json_loads(response.content)
         except Exception as e:
             # Handle JSON ERROR
             raise RuntimeError(f"Unable to parse the JSON : {e}")
@@ -2361,12 +2678,21 @@ class DomoticzInjector(Injector):
 
     def update_veolia_device(self, csv_file):
         self.mylog("Parsing veolia csv file")
+        historical_urls: list[tuple[str, str]] = []
+        idx = self.configuration[PARAM_DOMOTICZ_VEOLIA_IDX]
+        d2 = dt.date.today()
+        # Everything but svalue/nvalue is the same for every row, so
+        # encode the common prefix a single time.
+        base_url = (
+            "/json.htm?"
+            + urlencode({"type": "command", "param": "udevice", "idx": idx})
+            + "&svalue="
+        )
         with open(csv_file, encoding="utf_8") as f:
-            # Remove first line
-
-            # Parse each line of the file.
+            # Parse each line of the file; csv.reader is already an
+            # iterator, no need to materialize the whole file.
 
-            for row in list(csv.reader(f, delimiter=";")):
+            for row in csv.reader(f, delimiter=";"):
                 date = row[0][0:10]
                 date_time = row[0]
                 counter = row[1]
@@ -2384,8 +2710,11 @@ class DomoticzInjector(Injector):
                 # Check line integrity (Date starting by 2 or 1)
                 if date[0] == "2" or date[0] == "1":
                     # Verify data integrity :
-                    d1 = datetime.strptime(date, "%Y-%m-%d")
-                    d2 = datetime.now()
+                    # Fixed YYYY-MM-DD layout; direct slicing is much
+                    # cheaper than strptime's format-string walk.
+                    d1 = dt.date(
+                        int(date[0:4]), int(date[5:7]), int(date[8:10])
+                    )
                     if abs((d2 - d1).days) > 30:
                         raise RuntimeError(
                             "File contains too old data (monthly?!?): "
@@ -2393,28 +2722,38 @@ class DomoticzInjector(Injector):
                         )
 
                     # Generate 3 URLs: historical, daily, current
-                    url_args = {
-                        "type": "command",
-                        "param": "udevice",
-                        "idx": self.configuration[PARAM_DOMOTICZ_VEOLIA_IDX],
-                        "svalue": f"{counter};{conso};{date}",
-                    }
-                    url_historique = "/json.htm?" + urlencode(url_args)
+                    url_historique = base_url + quote_plus(
+                        f"{counter};{conso};{date}"
+                    )
+                    historical_urls.append((date, url_historique))
 
                     # Daily
-                    url_args["svalue"] = f"{counter};{conso};{date_time}"
-                    url_daily = "/json.htm?" + urlencode(url_args)
+                    url_daily = base_url + quote_plus(
+                        f"{counter};{conso};{date_time}"
+                    )
 
                     # Current
-                    url_args["nvalue"] = conso
-                    url_current = "/json.htm?" + urlencode(url_args)
+                    url_current = (
+                        url_daily + "&nvalue=" + quote_plus(conso)
+                    )
 
-                    # Send historical data.
+        # Send historical data; each row is an independent request so
+        # a few of them can be in flight at the same time instead of
+        # paying one full round-trip per row.
+        if historical_urls:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    (date, executor.submit(self.open_url, url))
+                    for date, url in historical_urls
+                ]
+                for date, future in futures:
+                    future.result()
                     self.mylog(f"    update value for {date}", end="")
-                    self.open_url(url_historique)
                     self.mylog(st="OK")
 
-        # Update Dashboard
+        # Update Dashboard. Current and daily both write the same
+        # device's svalue, so they must stay sequential: the final
+        # state depends on which update Domoticz processes last.
         if url_current:
             self.mylog("    update current value", end="")
             self.open_url(url_current)
@@ -2429,7 +2768,7 @@ class DomoticzInjector(Injector):
         raise NotImplementedError(f"{self.WORKER_DESC}/GRDF")
 
     def cleanup(self, keep_output=False):
-        pass
+        self._session.close()
 
 
 class HomeAssistantInjector(Injector):
@@ -2450,17 +2789,46 @@ class HomeAssistantInjector(Injector):
         super().__init__(
             config_dict, super_print=super_print, use_display=use_display
         )
-    
+
+        # Persistent session: pooled keep-alive connections to the HA
+        # server, with authentication headers computed only once. A
+        # single SSLContext is shared by the pool so TLS sessions can
+        # be resumed across calls.
+        ctx = ssl.create_default_context()
+        if self.configuration[PARAM_INSECURE]:
+            ctx.check_hostname = False
+            ctx.verify_mode = ssl.CERT_NONE
+        self._session = requests.Session()
+        adapter = SSLContextAdapter(
+            ssl_context=ctx,
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=urllib3.util.Retry(
+                total=2,
+                backoff_factor=1.5,
+                status_forcelist=(502, 503, 504),
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update(
+            {
+                "Authorization": "Bearer {}".format(
+                    self.configuration[PARAM_HA_TOKEN]
+                ),
+                "Content-Type": "application/json",
+            }
+        )
+        self._session.verify = not (self.configuration[PARAM_INSECURE])
+        self._base_url = str(self.configuration[PARAM_HA_SERVER]).rstrip("/")
+
     def update_grdf_historical_data(self, stats_array, pce):
         # Prepare the statistics that need to be sent
         self.mylog("Publish all the historical data in the statistics")
         data = {
             "has_mean": False,
             "has_sum": True,
-            "statistic_id": (
-                "sensor.grdf_%s_total"
-                % pce
-            ),
+            "statistic_id": f"sensor.grdf_{pce}_total",
             "unit_of_measurement": "m³",
             "source": "recorder",
             "stats": stats_array,
@@ -2475,31 +2843,20 @@ class HomeAssistantInjector(Injector):
         GET or POST (if data) request from Home Assistant API.
         """
         # Generate URL
-        api_url = self.configuration[PARAM_HA_SERVER] + uri
-
-        headers = {
-            "Authorization": "Bearer {}".format(
-                self.configuration[PARAM_HA_TOKEN]
-            ),
-            "Content-Type": "application/json",
-        }
+        api_url = self._base_url + uri
 
         try:
             if data is None:
-                response = requests.get(
-                    api_url,
-                    headers=headers,
-                    verify=not (self.configuration[PARAM_INSECURE]),
-                    timeout=30,
-                )
-
+                response = self._session.get(api_url, timeout=30)
             else:
-                response = requests.post(
-                    api_url,
-                    headers=headers,
-                    json=data,
-                    verify=not (self.configuration[PARAM_INSECURE]),
-                    timeout=30,
+                # Serialize with _json_dumps (orjson when available);
+                # the session already carries the JSON content type.
+                # Callers may pass pre-serialized bytes to share one
+                # encode between sensors posting the same payload.
+                if not isinstance(data, bytes):
+                    data = _json_dumps(data)
+                response = self._session.post(
+                    api_url, data=data, timeout=30
                 )
                 self.mylog(f"URL POST response: {response}")
         except Exception as e:
@@ -2509,22 +2866,32 @@ class HomeAssistantInjector(Injector):
         # HANDLE SERVER ERROR CODE
         if response.status_code not in (200, 201):
             raise RuntimeError(
-                "url=%s - (code = %u)\ncontent=%r)"
-                % (
-                    api_url,
-                    response.status_code,
-                    response.content,
-                )
+                f"url={api_url} - (code = {response.status_code})"
+                f"\ncontent={response.content!r})"
             )
 
         try:
-            j = json.loads(response.content.decode("utf-8"))
+            j = _json_loads(response.content)
         except Exception as e:
             # Handle JSON ERROR
             raise RuntimeError(f"Unable to parse JSON : {e}")
 
         return j
 
+    def _post_many(self, pairs):
+        """
+        POST several (uri, data) payloads concurrently over the shared
+        session; responses are returned in submission order.
+        """
+        if len(pairs) == 1:
+            return [self.open_url(*pairs[0])]
+        with ThreadPoolExecutor(max_workers=len(pairs)) as executor:
+            futures = [
+                executor.submit(self.open_url, uri, data)
+                for uri, data in pairs
+            ]
+            return [future.result() for future in futures]
+
     def sanity_check(self):
         self.mylog("Check Home Assistant connectivity", st="--", end="")
         response = self.open_url("/api/")
@@ -2534,11 +2901,8 @@ class HomeAssistantInjector(Injector):
             self.mylog(st="EE")
             if "result" not in response:
                 raise RuntimeError(
-                    "No valid response '%s' from %s"
-                    % (
-                        response["message"],
-                        self.configuration[PARAM_HA_SERVER],
-                    )
+                    f"No valid response '{response['message']}'"
+                    f" from {self.configuration[PARAM_HA_SERVER]}"
                 )
 
     def update_veolia_device(self, csv_file):
@@ -2548,95 +2912,100 @@ class HomeAssistantInjector(Injector):
         # pylint: disable=too-many-locals
         self.mylog("Parsing csv file")
 
-        with open(csv_file, encoding="utf_8") as f:
-            rows = list(csv.reader(f, delimiter=";"))
-            # List has at least two rows, the exception handles it.
-            row = rows[-1]
-            p_row = rows[-2]
-
-            method = row[3]  # "Mesuré" or "Estimé"
-            if method in ("Estimé",):
-                self.mylog(f"File contains estimated data in last line: {row}")
-                # Try previous row which may be a measurement
-                row = p_row
-                p_row = rows[-3]
-
-            date = row[0][0:10]
-            date_time = row[0]
-            meter_total = row[1]
-            meter_period_total = row[2]
-            method = row[3]  # "Mesuré" or "Estimé"
-
-            p_date_time = p_row[0]
-            p_meter_total = p_row[1]
-            p_meter_period_total = p_row[2]
-
-            if method in ("Estimé",):
-                self.mylog("    Skip Method " + method)
-                # Do not use estimated values which may result
-                # in a total that is not increasing
-                # (when the estimated value is smaller than the
-                #  previous real value or higher than the next
-                #  real value)
-                raise RuntimeError(
-                    f"File contains estimated data in last lines: {row!r}"
-                )
+        contract = self.configuration[PARAM_VEOLIA_CONTRACT]
+
+        # Only the file tail is used; read a window from the end
+        # of the file instead of streaming every row.
+        rows = _read_csv_tail(csv_file)
+        # List has at least two rows, the exception handles it.
+        row = rows[-1]
+        p_row = rows[-2]
+
+        method = row[3]  # "Mesuré" or "Estimé"
+        if method in ("Estimé",):
+            self.mylog(f"File contains estimated data in last line: {row}")
+            # Try previous row which may be a measurement
+            row = p_row
+            p_row = rows[-3]
+
+        date = row[0][0:10]
+        date_time = row[0]
+        meter_total = row[1]
+        meter_period_total = row[2]
+        method = row[3]  # "Mesuré" or "Estimé"
+
+        p_date_time = p_row[0]
+        p_meter_total = p_row[1]
+        p_meter_period_total = p_row[2]
+
+        if method in ("Estimé",):
+            self.mylog("    Skip Method " + method)
+            # Do not use estimated values which may result
+            # in a total that is not increasing
+            # (when the estimated value is smaller than the
+            #  previous real value or higher than the next
+            #  real value)
+            raise RuntimeError(
+                f"File contains estimated data in last lines: {row!r}"
+            )
 
-            # Check line integrity (Date starting with 2 (Year))
-            if date[0] == "2":
-                # Verify data integrity :
-                d1 = datetime.strptime(date, "%Y-%m-%d")
-                d2 = datetime.now()
-                if abs((d2 - d1).days) > 30:
-                    raise RuntimeError(
-                        f"File contains too old data (monthly?!?): {row!r}"
-                    )
-                self.mylog(
-                    f"    previous value  {p_date_time}: "
-                    f"{p_meter_total}L - {p_meter_period_total}L",
-                    end="",
-                )
-                self.mylog(
-                    f"    update value is {date_time}: "
-                    f"{meter_total}L - {meter_period_total}L",
-                    end="",
+        # Check line integrity (Date starting with 2 (Year))
+        if date[0] == "2":
+            # Verify data integrity :
+            # Fixed YYYY-MM-DD layout; direct slicing is much
+            # cheaper than strptime's format-string walk.
+            d1 = dt.date(
+                int(date[0:4]), int(date[5:7]), int(date[8:10])
+            )
+            d2 = dt.date.today()
+            if abs((d2 - d1).days) > 30:
+                raise RuntimeError(
+                    f"File contains too old data (monthly?!?): {row!r}"
                 )
+            self.mylog(
+                f"    previous value  {p_date_time}: "
+                f"{p_meter_total}L - {p_meter_period_total}L",
+                end="",
+            )
+            self.mylog(
+                f"    update value is {date_time}: "
+                f"{meter_total}L - {meter_period_total}L",
+                end="",
+            )
 
-                data = {
-                    "state": meter_total,
-                    "attributes": {
-                        "date_time": date_time,
-                        "unit_of_measurement": "L",
-                        "device_class": "water",
-                        "state_class": "total_increasing",
-                    },
-                }
-                self.open_url(
-                    HA_API_SENSOR_FORMAT
-                    % (
-                        "sensor.veolia_%s_total"
-                        % (self.configuration[PARAM_VEOLIA_CONTRACT],),
+            # The total and period sensors are independent: post both
+            # in one round-trip window.
+            self._post_many(
+                [
+                    (
+                        HA_API_SENSOR_FORMAT
+                        % (f"sensor.veolia_{contract}_total",),
+                        {
+                            "state": meter_total,
+                            "attributes": {
+                                "date_time": date_time,
+                                "unit_of_measurement": "L",
+                                "device_class": "water",
+                                "state_class": "total_increasing",
+                            },
+                        },
                     ),
-                    data,
-                )
-                data = {
-                    "state": meter_period_total,
-                    "attributes": {
-                        "date_time": date_time,
-                        "unit_of_measurement": "L",
-                        "device_class": "water",
-                        "state_class": "measurement",
-                    },
-                }
-                self.open_url(
-                    HA_API_SENSOR_FORMAT
-                    % (
-                        "sensor.veolia_%s_period_total"
-                        % (self.configuration[PARAM_VEOLIA_CONTRACT],),
+                    (
+                        HA_API_SENSOR_FORMAT
+                        % (f"sensor.veolia_{contract}_period_total",),
+                        {
+                            "state": meter_period_total,
+                            "attributes": {
+                                "date_time": date_time,
+                                "unit_of_measurement": "L",
+                                "device_class": "water",
+                                "state_class": "measurement",
+                            },
+                        },
                     ),
-                    data,
-                )
-                self.mylog(st="OK")
+                ]
+            )
+            self.mylog(st="OK")
 
     def get_date_from_ha_state(self, response):
         if "date_time" in response["attributes"]:
@@ -2661,10 +3030,10 @@ class HomeAssistantInjector(Injector):
         # pylint: disable=too-many-locals
         self.mylog("Parsing JSON file.")
 
-        with open(json_file, encoding="utf_8") as f:
-            data = json.load(f)
+        with open(json_file, "rb") as f:
+            data = _json_loads(f.read())
 
-        pce = list(data.keys())[0]
+        pce = next(iter(data))
         now_isostr = datetime.now(timezone.utc).isoformat()
 
         # M3 TOTAL
@@ -2677,6 +3046,19 @@ class HomeAssistantInjector(Injector):
         sensor_name_daily_generic_kwh = "sensor.gas_daily_kwh"
         sensor_name_daily_pce_kwh = f"sensor.grdf_{pce}_daily_kwh"
 
+        # Expand each sensor's API endpoint a single time.
+        sensor_uris = {
+            name: HA_API_SENSOR_FORMAT % (name,)
+            for name in (
+                sensor_name_generic_m3,
+                sensor_name_pce_m3,
+                sensor_name_generic_kwh,
+                sensor_name_pce_kwh,
+                sensor_name_daily_generic_kwh,
+                sensor_name_daily_pce_kwh,
+            )
+        }
+
         # Response looks like:
         # {'entity_id': 'sensor.gas_consumption_kwh', 'state': '28657',
         #  'attributes': {
@@ -2706,7 +3088,7 @@ class HomeAssistantInjector(Injector):
             sensor_name_generic_kwh,
         ):
             try:
-                response = self.open_url(HA_API_SENSOR_FORMAT % (sensor,))
+                response = self.open_url(sensor_uris[sensor])
             except RuntimeError:
                 response = None
 
@@ -2721,44 +3103,27 @@ class HomeAssistantInjector(Injector):
                     except ValueError:
                         pass
 
+                # The date is recovered from the kWh state itself
+                # (date_time/last_changed), which pre-upgrade sensors
+                # already carry even though they lack meter_m3.
+                rdate = self.get_date_from_ha_state(response)
+                if rdate is not None:
+                    previous_date = rdate
+                    self.mylog(
+                        f"Previous HA date (kWh) {previous_date}"
+                    )
+
                 attributes = response["attributes"]
                 if "meter_m3" in attributes:
                     try:
                         previous_m3 = float(attributes["meter_m3"])
-                        rdate = self.get_date_from_ha_state(response)
-                        if rdate is not None:
-                            previous_date = rdate
-                            self.mylog(
-                                f"Previous HA date (kWh) {previous_date}"
-                            )
                     except ValueError:
                         pass
                 break
 
-        # Get last known data now - from m3 sensor
-        for m3_sensor in (
-            sensor_name_pce_m3,
-            sensor_name_generic_m3,
-        ):
-            if previous_m3 is not None:
-                # m3 already known
-                break
-
-            # previous_m3 is None:
-            try:
-                sensor = m3_sensor
-                response = self.open_url(
-                    HA_API_SENSOR_FORMAT % (sensor_name_generic_m3,)
-                )
-
-                if isinstance(response, dict) and "state" in response:
-                    previous_m3 = float(response["state"])
-                    rdate = self.get_date_from_ha_state(response)
-                    if rdate is not None:
-                        previous_date = rdate
-                        self.mylog(f"Previous date (m3) {previous_date}")
-            except (ValueError, RuntimeError):
-                sensor = "None"  # For log message just below
+        # No fallback GET on the m3 sensors: the kWh write-back below
+        # stores meter_m3 in its attributes, so the read above (or the
+        # state file) is the single source for the previous index.
 
         if previous_kWh is None:
             state = get_state_file(self.configuration[STATE_FILE])
@@ -2779,68 +3144,84 @@ class HomeAssistantInjector(Injector):
         if previous_kWh is not None:
             current_total_kWh = previous_kWh
 
+        if previous_date is not None and previous_date.tzinfo is None:
+            # A naive timestamp (older state files) would make the
+            # comparisons with the tz-aware releve dates raise.
+            previous_date = previous_date.replace(tzinfo=timezone.utc)
+
         # sys.exit()   # For debug
+        # Collect the new measured rows first (one date parse per
+        # row), then derive the total and latest sample in one go.
         date_time = None
+        mesures = []
+        # Bind the hot lookups to locals once for the per-row loop.
+        _fromiso = dt.datetime.fromisoformat
         for row in data[pce]["releves"]:
-            row_date = row["dateFinReleve"]
-            row_date_time = dt.datetime.fromisoformat(row_date)
             row_data_qual = row[
                 "qualificationReleve"
             ]  # "Informative Journalier"
-            row_meter_kWh_day = row["energieConsomme"]
-            row_meter_m3_endIndex = row["indexFin"]
 
-            if row_data_qual != "Mesuré":
+            if row_data_qual != GRDF_QUAL_MEASURED:
                 # Known qualities:
                 # - "Mesuré"
                 # - "Absence de Données"
                 #    -> Seems to be updated later, so wait for it.
                 self.mylog(
-                    f"    Got Quality '{row_data_qual}@{row_date}'"
+                    f"    Got Quality"
+                    f" '{row_data_qual}@{row['dateFinReleve']}'"
                     " -> Wait until backlog retrieved"
                 )
                 break
-                # continue
 
-            if row_date_time > previous_date:
-                # Sum daily kWh consumption
-                # FEAT: May need to do more complex calculation
-                # to cope with kWh rounding
-                current_total_kWh += row_meter_kWh_day
-                self.mylog(
-                    f"New Total {current_total_kWh}kWh (+{row_meter_kWh_day})"
-                )
-            else:
+            row_date_time = _fromiso(row["dateFinReleve"])
+            if row_date_time <= previous_date:
                 # Not new data, continue with next data
                 continue
 
-            if (date_time is not None) and (row_date_time < date_time):
-                # Use the most recent data.
-                continue
+            row_index_fin = row["indexFin"]
+            if previous_m3 is not None and row_index_fin < previous_m3:
+                self.mylog(
+                    f"New index {row_index_fin} m³"
+                    f" ({row_date_time})"
+                    " is lower"
+                    f" than old index {previous_m3} m³ ({previous_date})."
+                    " Error in source or old data - stopping",
+                    st="EE",
+                )
+                break
 
-            if abs((row_date_time - datetime.now(timezone.utc)).days) > 30:
+            mesures.append(row)
+
+        if mesures:
+            # Sum daily kWh consumption
+            # FEAT: May need to do more complex calculation
+            # to cope with kWh rounding
+            added_kWh = sum(row["energieConsomme"] for row in mesures)
+            current_total_kWh += added_kWh
+            self.mylog(f"New Total {current_total_kWh}kWh (+{added_kWh})")
+
+            # Within one file the ISO dates share their UTC offset, so
+            # the lexicographic order is the chronological order; only
+            # the winning row needs an actual datetime.
+            latest = max(mesures, key=itemgetter("dateFinReleve"))
+            date_time = _fromiso(latest["dateFinReleve"])
+
+            # Check both ends of the accepted range: a recent newest
+            # row must not let arbitrarily old rows (monthly files,
+            # long backlogs) slip into the sum.
+            oldest = min(mesures, key=itemgetter("dateFinReleve"))
+            now = datetime.now(timezone.utc)
+            if abs((date_time - now).days) > 30:
                 raise RuntimeError(
-                    f"File contains too old data (monthly?!?): {row}"
+                    f"File contains too old data (monthly?!?): {latest}"
+                )
+            if abs((_fromiso(oldest["dateFinReleve"]) - now).days) > 30:
+                raise RuntimeError(
+                    f"File contains too old data (monthly?!?): {oldest}"
                 )
 
-            if previous_m3 is not None:
-                if row_meter_m3_endIndex < previous_m3:
-                    self.mylog(
-                        f"New index {row_meter_m3_endIndex} m³"
-                        f" ({row_date_time})"
-                        " is lower"
-                        f" than old index {previous_m3} m³ ({previous_date})."
-                        " Error in source or old data - stopping",
-                        st="EE",
-                    )
-                    break
-
-            # Acceptable data
-            date_time = row_date_time
-            # date_type = row["indexFin"]  # "Informative Journalier"
-
-            meter_m3_total = row_meter_m3_endIndex
-            meter_kWh_day = row["energieConsomme"]
+            meter_m3_total = latest["indexFin"]
+            meter_kWh_day = latest["energieConsomme"]
 
         # Has data (latest data)
         if date_time is None:
@@ -2874,14 +3255,16 @@ class HomeAssistantInjector(Injector):
                     "last_check": now_isostr,
                 },
             }
-            r = self.open_url(
-                HA_API_SENSOR_FORMAT % (sensor_name_generic_m3,), entity_data
-            )
-            self.mylog(f"{r!r}")
-            r = self.open_url(
-                HA_API_SENSOR_FORMAT % (sensor_name_pce_m3,), entity_data
-            )
-            self.mylog(f"{r!r}")
+            # The generic and per-PCE sensors are independent: post
+            # both in one round-trip window, serialized once.
+            body = _json_dumps(entity_data)
+            for r in self._post_many(
+                [
+                    (sensor_uris[sensor_name_generic_m3], body),
+                    (sensor_uris[sensor_name_pce_m3], body),
+                ]
+            ):
+                self.mylog(f"{r!r}")
 
             # kWh Daily
             entity_data = {
@@ -2895,19 +3278,18 @@ class HomeAssistantInjector(Injector):
                 },
             }
 
-            r = self.open_url(
-                HA_API_SENSOR_FORMAT % (sensor_name_daily_generic_kwh,),
-                entity_data,
-            )
-            self.mylog(f"{r!r}")
-
-            r = self.open_url(
-                HA_API_SENSOR_FORMAT % (sensor_name_daily_pce_kwh,),
-                entity_data,
-            )
-            self.mylog(f"{r!r}")
+            body = _json_dumps(entity_data)
+            for r in self._post_many(
+                [
+                    (sensor_uris[sensor_name_daily_generic_kwh], body),
+                    (sensor_uris[sensor_name_daily_pce_kwh], body),
+                ]
+            ):
+                self.mylog(f"{r!r}")
 
-            # Total kWh
+            # Total kWh. meter_m3 rides along in the attributes so the
+            # next run recovers the previous index from this single
+            # sensor without querying the m3 sensors.
             entity_data = {
                 "state": current_total_kWh,
                 "attributes": {
@@ -2916,11 +3298,12 @@ class HomeAssistantInjector(Injector):
                     "device_class": "energy",
                     "state_class": "total_increasing",
                     "last_check": now_isostr,
+                    "meter_m3": meter_m3_total,
                 },
             }
 
             r = self.open_url(
-                HA_API_SENSOR_FORMAT % (sensor_name_generic_kwh,), entity_data
+                sensor_uris[sensor_name_generic_kwh], entity_data
             )
 
             # Store state to local file to cope with HA restart
@@ -2931,14 +3314,14 @@ class HomeAssistantInjector(Injector):
 
             self.mylog(f"{r!r}")
             r = self.open_url(
-                HA_API_SENSOR_FORMAT % (sensor_name_pce_kwh,), entity_data
+                sensor_uris[sensor_name_pce_kwh], entity_data
             )
             self.mylog(f"{r!r}")
 
             self.mylog(st="OK")
 
     def cleanup(self, keep_output=False):
-        pass
+        self._session.close()
 
 
 class MqttInjector(Injector):
@@ -3022,7 +3405,7 @@ class MqttInjector(Injector):
             data = json.load(f)
        
         if len(data) > 0:
-          pce = list(data.keys())[0]
+          pce = next(iter(data))
           data = data[pce]["releves"][-1]
           self.mylog(f"MQTT GRDF data: {data}")
         else:
@@ -3237,6 +3620,31 @@ def exit_on_error(
     sys.exit(2)
 
 
+def fetch_with_retry(o, fetch, crawler=None, screenshot=None):
+    """
+    Run a crawler fetch, retrying once on failure: the stalemate
+    exceptions the portals raise sometimes clear on a second pass.
+    Optionally captures a screenshot between the attempts.
+    """
+    try:
+        return fetch()
+    except Exception:
+        exc_info = " - ".join(traceback.format_exc().splitlines())
+        o.mylog(exc_info, st="WW")
+
+        if crawler is not None and screenshot:
+            try:
+                crawler.get_screenshot(screenshot)
+            except Exception:
+                pass
+
+        o.mylog(
+            "Encountered error -> Retrying once",
+            st="WW",
+        )
+        return fetch()
+
+
 def get_state_file(file):
     try:
         with open(file, encoding="utf_8") as state_file:
@@ -3266,22 +3674,57 @@ def update_state_file(file, data):
         pass
 
 
-def check_new_script_version(o):
+# Shared pool for the direct urllib3 requests below.
+_HTTP = urllib3.PoolManager()
+
+
+def check_new_script_version(o, logs_folder=None):
     # FEAT: Check only if not running in HAOS (AppDaemon) instance
     #       Maybe with env variable?
     o.mylog("Check script version is up to date", end="")
+
+    # The release tag is cached on disk for a day: cron runs every
+    # few minutes should not hit the GitHub API (rate limits, and a
+    # few hundred ms of latency) for an answer that rarely changes.
+    cache_file = None
+    if logs_folder:
+        cache_file = os.path.join(logs_folder, ".version_check")
+        try:
+            if os.path.getmtime(cache_file) > time.time() - 86400:
+                with open(cache_file, encoding="utf_8") as f:
+                    tag_name = f.read().strip()
+                if tag_name:
+                    if tag_name > VERSION:
+                        o.mylog(
+                            f'New version "{tag_name}" available.'
+                            f"Check : https://github.com/{REPO_BASE}"
+                            "/releases/latest",
+                            st="WW",
+                        )
+                    else:
+                        o.mylog(st="OK")
+                    return
+        except OSError:
+            # No cache yet (or unreadable): query the API.
+            pass
+
     try:
-        http = urllib3.PoolManager()
         user_agent = {"user-agent": "meters_to_ha - " + VERSION}
-        r = http.request(
+        r = _HTTP.request(
             "GET",
             f"https://api.github.com/repos/{REPO_BASE}/releases/latest",
             headers=user_agent,
         )
-        j = json.loads(r.data.decode("utf-8"))
+        j = _json_loads(r.data)
     except Exception:
         raise
     else:
+        if cache_file is not None:
+            try:
+                with open(cache_file, "w", encoding="utf_8") as f:
+                    f.write(j["tag_name"])
+            except OSError:
+                pass
         if j["tag_name"] > VERSION:
             o.mylog(
                 f'New version "{j["name"]}"({j["tag_name"]}) available.'
@@ -3294,6 +3737,12 @@ def check_new_script_version(o):
 
 def doWork():
     # pylint:disable=too-many-locals
+    # Fast path: print the version without building the full argument
+    # parser, which costs tens of ms on small boards.
+    if len(sys.argv) == 2 and sys.argv[1] == "--version":
+        print(VERSION)
+        sys.exit(0)
+
     # Default config value
     script_dir = os.path.dirname(os.path.realpath(__file__)) + os.path.sep
     default_logfolder = script_dir
@@ -3440,7 +3889,9 @@ def doWork():
     # New version checking
     if args.version_check:
         try:
-            check_new_script_version(o)
+            check_new_script_version(
+                o, str(args.logs_folder).strip("[]'")
+            )
         except Exception as exc:
             exit_on_error(string=str(exc), use_display=args.display, o=o)
 
@@ -3552,18 +4003,7 @@ def doWork():
     if args.grdf:
         try:
             # Get data
-            try:
-                gazpar_file = crawler.get_gazpar_file()
-            except Exception:
-                exc_info = " - ".join(traceback.format_exc().splitlines())
-                # Retry once on failure to manage stalement
-                # exception that occurs sometimes
-                o.mylog(exc_info, st="WW")
-                o.mylog(
-                    "Encountered error -> Retrying once",
-                    st="WW",
-                )
-                gazpar_file = crawler.get_gazpar_file()
+            gazpar_file = fetch_with_retry(o, crawler.get_gazpar_file)
             o.mylog(f"Gazpar_file: {gazpar_file}", st="WW")
             # Inject data
             injector.update_grdf_device(gazpar_file)
@@ -3580,26 +4020,17 @@ def doWork():
 
     if args.veolia:
         try:
-            try:
-                veolia_idf_file = crawler.get_veolia_idf_file()
-                # veolia_idf_file = "./veolia_test_data.csv"
-            except Exception:
-                exc_info = " - ".join(traceback.format_exc().splitlines())
-                o.mylog(exc_info, st="WW")
-
-                try:
-                    if configuration_json[PARAM_SCREENSHOT]:
-                        crawler.get_screenshot("screen_on_exception1.png")
-                except Exception:
-                    pass
-
-                # Retry once on failure to manage
-                # stalement exception that occurs sometimes
-                o.mylog(
-                    "Encountered error -> Retrying once",
-                    st="WW",
-                )
-                veolia_idf_file = crawler.get_veolia_idf_file()
+            veolia_idf_file = fetch_with_retry(
+                o,
+                crawler.get_veolia_idf_file,
+                crawler=crawler,
+                screenshot=(
+                    "screen_on_exception1.png"
+                    if configuration_json.get(PARAM_SCREENSHOT)
+                    else None
+                ),
+            )
+            # veolia_idf_file = "./veolia_test_data.csv"
 
             injector.update_veolia_device(veolia_idf_file)
         except Exception as exc: